@@ -1,3 +1,4 @@
+import os
 import pandas as pd
 import numpy as np
 import linecache
@@ -229,10 +230,13 @@ class FileReader:
         # Convert the DataFrame to a formatted string with adjusted column widths
         data_str = self.df.to_string(index=False, justify='right', col_space=column_widths)
 
-        # Write the string to a .txt file
-        with open(self.path, 'w') as file:
+        # Write the string to a temporary file and rename it over the original,
+        # so a hardlinked original (see TxtinoutReader.copy_swat) is left untouched
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w') as file:
             file.write(self.header_file)
             file.write(data_str)
+        os.replace(tmp_path, self.path)
         
     
     def _store_csv(self) -> None:
@@ -1,8 +1,12 @@
 import subprocess
 import os
+import io
+import stat
 from pySWATPlus.FileReader import FileReader
 import shutil
 import tempfile
+import functools
+import concurrent.futures
 import multiprocessing
 import tqdm
 from pathlib import Path
@@ -12,8 +16,202 @@ import dask.distributed
 import re
 
 
+# buffer size for reading and writing SWAT text files (fewer syscalls than the default 8KB)
+_BUF = 1 << 20
+
+
+def _link_or_copy(src: str, dst: str) -> None:
+    """
+    Hardlink 'src' to 'dst', falling back to a regular copy when linking is not possible
+    (e.g. the destination is on another filesystem).
+
+    Parameters:
+    src (str): The path to the source file.
+    dst (str): The path to the destination file.
+
+    Returns:
+    None
+    """
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+def _atomic_write(path: Path, data: str) -> None:
+    """
+    Write 'data' to 'path' atomically, by writing a temporary file in the same folder and
+    renaming it over the target. A crash mid-write can no longer leave a half-written SWAT
+    input behind, and the fresh inode leaves hardlinked originals (see copy_swat) untouched.
+
+    Parameters:
+    path (Path): The path to the file to write.
+    data (str): The content to write.
+
+    Returns:
+    None
+    """
+    tmp_path = path.with_suffix(path.suffix + '.tmp')
+    with open(tmp_path, 'w', buffering=_BUF) as file:
+        file.write(data)
+    os.replace(tmp_path, path)
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_date(date_str: str) -> Tuple[int, int]:
+    """
+    Parse (and cache) a 'YYYY-MM-DD' date string.
+
+    Parameters:
+    date_str (str): The date in 'YYYY-MM-DD' format.
+
+    Returns:
+    Tuple[int, int]: The day of the year and the year.
+    """
+    year, month, day = date_str.split("-")
+    date = datetime.date(int(year), int(month), int(day))
+    return date.timetuple().tm_yday, date.year
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_tpl_pattern(keys: Tuple[str, ...]) -> 're.Pattern':
+    """
+    Compile (and cache) a single alternation pattern matching any #key# marker.
+
+    Parameters:
+    keys (Tuple[str, ...]): The sorted tuple of parameter names to match.
+
+    Returns:
+    re.Pattern: A compiled pattern matching '#key#' for every key, with the key name captured in group 1.
+    """
+    return re.compile("#(" + "|".join(map(re.escape, keys)) + ")#")
+
+
+class _PrintPrtEditor:
+
+    def __init__(self, reader: 'TxtinoutReader') -> None:
+        """
+        Initialize an in-memory editor for the 'print.prt' file.
+
+        The file is read once on entering the context, edits are applied to the cached
+        lines, and the result is written back once on exit. Use through
+        TxtinoutReader.edit_print_prt.
+
+        Parameters:
+        reader (TxtinoutReader): The reader whose 'print.prt' file will be edited.
+
+        Attributes:
+        lines (List[str]): The cached lines of the 'print.prt' file.
+        """
+        self._reader = reader
+        self._path = reader.root_folder / 'print.prt'
+        self.lines = []
+
+    def __enter__(self) -> '_PrintPrtEditor':
+        self.lines = self._reader._read_print_prt()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        # only write back if no exception occurred inside the context
+        if exc_type is None:
+            _atomic_write(self._path, "".join(self.lines))
+            self._reader._store_print_prt_cache(self.lines)
+
+    def enable_object(self, obj: str, daily: bool, monthly: bool, yearly: bool, avann: bool) -> None:
+        """
+        Enable or update an object in the cached lines. If obj is not a default identifier, it will be added at the end.
+
+        Parameters:
+        obj (str): The object name or identifier.
+        daily (bool): Flag for daily print frequency.
+        monthly (bool): Flag for monthly print frequency.
+        yearly (bool): Flag for yearly print frequency.
+        avann (bool): Flag for average annual print frequency.
+
+        Returns:
+        None
+        """
+
+        # check if obj is object itself or file
+        if os.path.splitext(obj)[1] != '':
+            arg_to_add = obj.rsplit('_', maxsplit=1)[0]
+        else:
+            arg_to_add = obj
+
+        new_line = self._reader._build_line_to_add(arg_to_add, daily, monthly, yearly, avann)
+
+        found = False
+        for i, line in enumerate(self.lines):
+            # Line must start exactly with arg_to_add, not a word that starts with arg_to_add
+            if line.startswith(arg_to_add + ' '):
+                # obj already exist, replace it in same position
+                self.lines[i] = new_line
+                found = True
+
+        if not found:
+            self.lines.append(new_line)
+
+    def set_time(self, start_date: str = None, end_date: str = None, warmup: int = 0, interval: int = 1) -> None:
+        """
+        Modify the warmup period and print interval in the cached lines.
+
+        Parameters:
+        start_date (str): The new start date
+        end_date (str): The new end date
+        warmup (int): The new warmup period value.
+        interval (int): The new print interval
+
+        Returns:
+        None
+        """
+        nth_line = 3
+
+        # Split the input string by spaces
+        elements = self.lines[nth_line - 1].split()
+
+        elements[0] = warmup
+        elements[5] = interval
+        # Use nyskip or specific time
+        if start_date and end_date:
+            # Calculate nday and year
+            day_start, year_start = _parse_date(start_date)
+            day_end, year_end = _parse_date(end_date)
+            elements[1] = day_start
+            elements[2] = year_start
+            elements[3] = day_end
+            elements[4] = year_end
+        else:
+            elements[1] = 0
+            elements[2] = 0
+            elements[3] = 0
+            elements[4] = 0
+
+        # Reconstruct the result string while maintaining spaces
+        self.lines[nth_line - 1] = '{: <12} {: <11} {: <11} {: <10} {: <10} {: <10} \n'.format(*elements)
+
+    def set_csv(self, enable: bool = True) -> None:
+        """
+        Enable or disable CSV print in the cached lines.
+
+        Parameters:
+        enable (bool, optional): True to enable CSV print, False to disable (default is True).
+
+        Returns:
+        None
+        """
+        nth_line = 7
+
+        if enable:
+            self.lines[nth_line - 1] = 'y' + self.lines[nth_line - 1][1:]
+        else:
+            self.lines[nth_line - 1] = 'n' + self.lines[nth_line - 1][1:]
+
+
 class TxtinoutReader:
 
+    # output-file suffixes that copy_swat must not carry over to the destination folder
+    _SKIP_SUFFIXES = ('_aa.txt', '_aa.csv', '_yr.txt', '_yr.csv', '_day.txt', '_day.csv', '_mon.txt', '_mon.csv')
+
     def __init__(self, path: str) -> None:
 
         """
@@ -42,24 +240,58 @@ class TxtinoutReader:
         if not os.path.isdir(path):
             raise FileNotFoundError("folder does not exist")
 
-        # count files that end with .exe
-        count = 0
-        swat_exe = None
-        for file in os.listdir(path):
-            if file.endswith(".exe"):
-                if count == 0:
-                    swat_exe = file
-                elif count > 0:
-                    raise TypeError("More than one .exe file found in the parent folder")
-                count += 1
-
-        if count == 0:
+        # find files that end with .exe
+        with os.scandir(path) as entries:
+            exe_files = [entry.name for entry in entries if entry.is_file() and entry.name.endswith(".exe")]
+
+        if len(exe_files) > 1:
+            raise TypeError("More than one .exe file found in the parent folder")
+
+        if len(exe_files) == 0:
             raise TypeError(".exe not found in parent folder")
 
+        swat_exe = exe_files[0]
+
         # find parent directory
         self.root_folder = path
         self.swat_exe_path = path / swat_exe
 
+        # instance-level cache of the print.prt lines, keyed by the file's mtime
+        self._prt_mtime = None
+        self._prt_lines = None
+
+    def _read_print_prt(self) -> List[str]:
+        """
+        Read the lines of the 'print.prt' file, reusing the instance-level cache when the
+        file has not changed on disk since the last read.
+
+        Returns:
+        List[str]: A copy of the file's lines, safe to mutate.
+        """
+        print_prt_path = self.root_folder / 'print.prt'
+        mtime = os.stat(print_prt_path).st_mtime_ns
+
+        if self._prt_mtime != mtime:
+            with open(print_prt_path, buffering=_BUF) as file:
+                self._prt_lines = file.read().splitlines(keepends=True)
+            self._prt_mtime = mtime
+
+        return list(self._prt_lines)
+
+    def _store_print_prt_cache(self, lines: List[str]) -> None:
+        """
+        Refresh the instance-level cache after the 'print.prt' file has been rewritten.
+
+        Parameters:
+        lines (List[str]): The lines that were just written to the file.
+
+        Returns:
+        None
+        """
+        print_prt_path = self.root_folder / 'print.prt'
+        self._prt_lines = list(lines)
+        self._prt_mtime = os.stat(print_prt_path).st_mtime_ns
+
     def _build_line_to_add(self, obj: str, daily: bool, monthly: bool, yearly: bool, avann: bool) -> str:
         """
         Build a line to add to the 'print.prt' file based on the provided parameters.
@@ -74,25 +306,29 @@ class TxtinoutReader:
         Returns:
         str: A formatted string representing the line to add to the 'print.prt' file.
         """
-        print_periodicity = {
-            'daily': daily,
-            'monthly': monthly,
-            'yearly': yearly,
-            'avann': avann,
-        }
+        arg_to_add = (f"{obj:<29}"
+                      f"{'y' if daily else 'n':<14}"
+                      f"{'y' if monthly else 'n':<14}"
+                      f"{'y' if yearly else 'n':<14}"
+                      f"{'y' if avann else 'n':<14}")
+        return arg_to_add.rstrip() + '\n'
+
+    def edit_print_prt(self) -> _PrintPrtEditor:
+        """
+        Return a context-managed editor for the 'print.prt' file.
 
-        arg_to_add = obj.ljust(29)
-        for value in print_periodicity.values():
-            if value:
-                periodicity = 'y'
-            else:
-                periodicity = 'n'
+        The editor reads the file once, applies all edits in memory and writes the result
+        back once on exit, so several consecutive edits share a single read and write:
 
-            arg_to_add += periodicity.ljust(14)
+            with reader.edit_print_prt() as prt:
+                prt.enable_object('channel_sd', True, False, False, False)
+                prt.set_time(warmup=1)
+                prt.set_csv(True)
 
-        arg_to_add = arg_to_add.rstrip()
-        arg_to_add += '\n'
-        return arg_to_add
+        Returns:
+        _PrintPrtEditor: The editor instance, to be used as a context manager.
+        """
+        return _PrintPrtEditor(self)
 
     def enable_object_in_print_prt(self, obj: str, daily: bool, monthly: bool, yearly: bool, avann: bool) -> None:
         """
@@ -108,33 +344,8 @@ class TxtinoutReader:
         Returns:
         None
         """
-
-        # check if obj is object itself or file
-        if os.path.splitext(obj)[1] != '':
-            arg_to_add = obj.rsplit('_', maxsplit=1)[0]
-        else:
-            arg_to_add = obj
-
-        # read all print_prt file, line by line
-        print_prt_path = self.root_folder / 'print.prt'
-        new_print_prt = ""
-        found = False
-        with open(print_prt_path) as file:
-            for line in file:
-                if not line.startswith(
-                        arg_to_add + ' '):  # Line must start exactly with arg_to_add, not a word that starts with arg_to_add
-                    new_print_prt += line
-                else:
-                    # obj already exist, replace it in same position
-                    new_print_prt += self._build_line_to_add(arg_to_add, daily, monthly, yearly, avann)
-                    found = True
-
-        if not found:
-            new_print_prt += self._build_line_to_add(arg_to_add, daily, monthly, yearly, avann)
-
-        # store new print_prt
-        with open(print_prt_path, 'w') as file:
-            file.write(new_print_prt)
+        with self.edit_print_prt() as prt:
+            prt.enable_object(obj, daily, monthly, yearly, avann)
 
     # modify yrc_start and yrc_end
     def set_simulation_time(self, start_date: str, end_date: str, step: int = 0) -> None:
@@ -157,35 +368,29 @@ class TxtinoutReader:
         # time_sim_path = f"{self.root_folder}\\{'time.sim'}"
         time_sim_path = self.root_folder / 'time.sim'
 
-        start = datetime.datetime.strptime(start_date, "%Y-%m-%d")
-        end = datetime.datetime.strptime(end_date, "%Y-%m-%d")
-        day_start = start.timetuple().tm_yday
-        year_start = start.timetuple().tm_year
-        day_end = end.timetuple().tm_yday
-        year_end = end.timetuple().tm_year
-
-        # Open the file in read mode and read its contents
-        with open(time_sim_path, 'r') as file:
-            lines = file.readlines()
-
-        year_line = lines[nth_line - 1]
+        day_start, year_start = _parse_date(start_date)
+        day_end, year_end = _parse_date(end_date)
 
-        # Split the input string by spaces
-        elements = year_line.split()
+        # Stream the file, rewriting only the nth line
+        output = io.StringIO()
+        with open(time_sim_path, 'r', buffering=_BUF) as file:
+            for line_number, line in enumerate(file, start=1):
+                if line_number == nth_line:
+                    # Split the input string by spaces
+                    elements = line.split()
 
-        elements[0] = day_start
-        elements[1] = year_start
-        elements[2] = day_end
-        elements[3] = year_end
-        elements[4] = step
+                    elements[0] = day_start
+                    elements[1] = year_start
+                    elements[2] = day_end
+                    elements[3] = year_end
+                    elements[4] = step
 
-        # Reconstruct the result string while maintaining spaces
-        result_string = '{: >8} {: >10} {: >10} {: >10} {: >10} \n'.format(*elements)
+                    # Reconstruct the result string while maintaining spaces
+                    line = '{: >8} {: >10} {: >10} {: >10} {: >10} \n'.format(*elements)
 
-        lines[nth_line - 1] = result_string
+                output.write(line)
 
-        with open(time_sim_path, 'w') as file:
-            file.writelines(lines)
+        _atomic_write(time_sim_path, output.getvalue())
 
     # modify warmup
     def set_print_time(self, start_date: str = None, end_date: str = None, warmup: int = 0, interval: int = 1) -> None:
@@ -201,46 +406,8 @@ class TxtinoutReader:
         Returns:
         None
         """
-        time_sim_path = self.root_folder / 'print.prt'
-
-        # Open the file in read mode and read its contents
-        with open(time_sim_path, 'r') as file:
-            lines = file.readlines()
-
-        nth_line = 3
-        year_line = lines[nth_line - 1]
-
-        # Split the input string by spaces
-        elements = year_line.split()
-
-        elements[0] = warmup
-        elements[5] = interval
-        # Use nyskip or specific time
-        if start_date and end_date:
-            # Calculate nday and year
-            start = datetime.datetime.strptime(start_date, "%Y-%m-%d")
-            end = datetime.datetime.strptime(end_date, "%Y-%m-%d")
-            day_start = start.timetuple().tm_yday
-            year_start = start.timetuple().tm_year
-            day_end = end.timetuple().tm_yday
-            year_end = end.timetuple().tm_year
-            elements[1] = day_start
-            elements[2] = year_start
-            elements[3] = day_end
-            elements[4] = year_end
-        else:
-            elements[1] = 0
-            elements[2] = 0
-            elements[3] = 0
-            elements[4] = 0
-
-        # Reconstruct the result string while maintaining spaces
-        result_string = '{: <12} {: <11} {: <11} {: <10} {: <10} {: <10} \n'.format(*elements)
-
-        lines[nth_line - 1] = result_string
-
-        with open(time_sim_path, 'w') as file:
-            file.writelines(lines)
+        with self.edit_print_prt() as prt:
+            prt.set_time(start_date, end_date, warmup, interval)
 
     # 改变参数
     def change_params(self, tpl_filename: str, params: Dict[str, Dict]):
@@ -259,13 +426,18 @@ class TxtinoutReader:
         new_filename = tpl_filename.rsplit(".", 1)[0]
         tpl_path = self.root_folder / tpl_filename
         new_path = self.root_folder / new_filename
-        with open(tpl_path) as file:
-            lines = file.readlines()
-            new_lines = "".join(lines)
-            for k, v in params.items():
-                new_lines = re.sub("#" + k + "#", str(v), new_lines)
-        with open(new_path, "w") as file:
-            file.write(new_lines)
+        with open(tpl_path, buffering=_BUF) as file:
+            new_lines = file.read()
+        if len(params) == 1:
+            # a single literal #key# marker: plain str.replace skips the regex engine entirely
+            (k, v), = params.items()
+            new_lines = new_lines.replace("#" + k + "#", str(v))
+        elif params:
+            # one compiled alternation (cached across simulations) applied in a single pass,
+            # so markers that are prefixes of each other are still substituted correctly
+            pattern = _compile_tpl_pattern(tuple(sorted(params)))
+            new_lines = pattern.sub(lambda m: str(params[m.group(1)]), new_lines)
+        _atomic_write(new_path, new_lines)
 
     def _enable_disable_csv_print(self, enable: bool = True) -> None:
         """
@@ -278,23 +450,8 @@ class TxtinoutReader:
         None
         """
 
-        # read
-        nth_line = 7
-
-        # time_sim_path = f"{self.root_folder}\\{'time.sim'}"
-        print_prt_path = self.root_folder / 'print.prt'
-
-        # Open the file in read mode and read its contents
-        with open(print_prt_path, 'r') as file:
-            lines = file.readlines()
-
-        if enable:
-            lines[nth_line - 1] = 'y' + lines[nth_line - 1][1:]
-        else:
-            lines[nth_line - 1] = 'n' + lines[nth_line - 1][1:]
-
-        with open(print_prt_path, 'w') as file:
-            file.writelines(lines)
+        with self.edit_print_prt() as prt:
+            prt.set_csv(enable)
 
     def enable_csv_print(self) -> None:
         """
@@ -355,6 +512,16 @@ class TxtinoutReader:
         str: The path to the directory where the SWAT model files were copied.
         """
 
+        # probe dir once instead of separate isdir/isfile checks
+        dir_is_dir = dir_is_file = False
+        if dir is not None:
+            try:
+                dir_stat = os.stat(dir)
+                dir_is_dir = stat.S_ISDIR(dir_stat.st_mode)
+                dir_is_file = stat.S_ISREG(dir_stat.st_mode)
+            except FileNotFoundError:
+                pass
+
         # if dir is None or dir is a folder and overwrite is False, create a new folder using mkdtemp
         if (dir is None) or (not overwrite and dir is not None):
 
@@ -367,27 +534,27 @@ class TxtinoutReader:
         # if dir is a folder and overwrite is True, delete all contents
         elif overwrite:
 
-            if os.path.isdir(dir):
+            if dir_is_dir:
 
                 temp_folder_path = dir
 
                 # delete all files in dir
-                for file in os.listdir(dir):
-                    file_path = os.path.join(dir, file)
-                    try:
-                        if os.path.isfile(file_path):
-                            os.remove(file_path)
-                    except Exception as e:
-                        print(e)
+                with os.scandir(dir) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_file():
+                                os.remove(entry.path)
+                        except Exception as e:
+                            print(e)
 
             else:  # if overwrite and dir is not a folder, create dir anyway
                 os.makedirs(dir, exist_ok=True)
                 temp_folder_path = dir
 
         # check if dir does not exist
-        elif not os.path.isdir(dir):
+        elif not dir_is_dir:
             # check if dir is a file
-            if os.path.isfile(dir):
+            if dir_is_file:
                 raise TypeError("dir must be a folder")
 
             # create dir
@@ -397,19 +564,14 @@ class TxtinoutReader:
         else:
             raise TypeError("option not recognized")
 
-        # Get the list of files in the source folder
+        # Exclude output files and hardlink (or copy) the remaining files in parallel
         source_folder = self.root_folder
-        files = os.listdir(source_folder)
-
-        # Exclude files with the specified suffix and copy the remaining files
-        for file in files:
-            if not file.endswith('_aa.txt') and not file.endswith('_aa.csv') and not file.endswith(
-                    '_yr.txt') and not file.endswith('_yr.csv') and not file.endswith('_day.txt') and not file.endswith(
-                    '_day.csv') and not file.endswith('_mon.csv') and not file.endswith('_mon.txt'):
-                source_file = os.path.join(source_folder, file)
-                destination_file = os.path.join(temp_folder_path, file)
+        with os.scandir(source_folder) as entries:
+            files_to_copy = [(entry.path, os.path.join(temp_folder_path, entry.name))
+                             for entry in entries if not entry.name.endswith(self._SKIP_SUFFIXES)]
 
-                shutil.copy2(source_file, destination_file)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(32, os.cpu_count() * 4)) as executor:
+            list(executor.map(lambda paths: _link_or_copy(*paths), files_to_copy))
 
         return temp_folder_path
 
@@ -427,27 +589,19 @@ class TxtinoutReader:
         # Run siumulation
         swat_exe_path = self.swat_exe_path
 
-        os.chdir(self.root_folder)
+        # If output is suppressed, skip piping and decoding entirely
+        if not show_output:
+            subprocess.run(swat_exe_path, cwd=str(self.root_folder),
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            return
 
-        with subprocess.Popen(swat_exe_path, stdout=subprocess.PIPE, stderr=subprocess.PIPE) as process:
+        with subprocess.Popen(swat_exe_path, cwd=str(self.root_folder),
+                              stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                              text=True, encoding='latin-1', errors='replace', bufsize=1) as process:
             # Read and print the output while it's being produced
-            while True:
-                # Read a line of output
-                raw_output = process.stdout.readline()
-
-                # Check if the output is empty and the subprocess has finished
-                if raw_output == b'' and process.poll() is not None:
-                    break
-
-                # Decode the output using 'latin-1' encoding
-                try:
-                    output = raw_output.decode('latin-1').strip()
-                except UnicodeDecodeError:
-                    # Handle decoding errors here (e.g., skip or replace invalid characters)
-                    continue
-
-                # Print the decoded output if needed
-                if output and show_output:
+            for line in process.stdout:
+                output = line.strip()
+                if output:
                     print(output)
 
     """
@@ -471,22 +625,30 @@ class TxtinoutReader:
         str: The path to the directory where the SWAT simulation was executed.
         """
 
-        aux_txtinout = TxtinoutReader(self.root_folder)
-
         # Modify files for simulation
         for filename, file_params in params.items():
 
             id_col, file_mods = file_params
 
             # get file
-            file = aux_txtinout.register_file(filename, has_units=False, index=id_col)
+            file = self.register_file(filename, has_units=False, index=id_col)
 
-            # for each col_name in file_params
+            # group modifications by column
+            broadcast_mods = {}
+            keyed_mods = {}
             for id, col_name, value in file_mods:  # if id is not given, value will be applied to all rows
                 if id is None:
-                    file.df[col_name] = value
+                    broadcast_mods[col_name] = value
                 else:
-                    file.df.loc[id, col_name] = value
+                    ids, values = keyed_mods.setdefault(col_name, ([], []))
+                    ids.append(id)
+                    values.append(value)
+
+            # one vectorized assignment per column instead of one per modification
+            for col_name, value in broadcast_mods.items():
+                file.df[col_name] = value
+            for col_name, (ids, values) in keyed_mods.items():
+                file.df.loc[ids, col_name] = values
 
             # store file
             file.overwrite_file()
@@ -499,7 +661,7 @@ class TxtinoutReader:
 
         # run simulation
         # print(f'Simulation started at {beginning.strftime("%H:%M:%S")}. Stored at {str(self.root_folder)}.')
-        aux_txtinout._run_swat(show_output=show_output)
+        self._run_swat(show_output=show_output)
         end = datetime.datetime.now()
         td = end - beginning
 
@@ -583,24 +745,18 @@ class TxtinoutReader:
         max_treads = multiprocessing.cpu_count()
         threads = max(min(n_workers, max_treads), 1)
 
-        if client is None:
+        items = [[dir, False, p, {}, False] for p in params]
 
-            results_ret = []
+        if client is None:
 
-            for i in tqdm.tqdm(range(len(params))):
-                results_ret.append(self.copy_and_run(dir=dir,
-                                                     overwrite=False,
-                                                     params=params[i],
-                                                     show_output=False))
+            with multiprocessing.Pool(threads) as pool:
+                results_ret = list(tqdm.tqdm(pool.imap(self.copy_and_run_star, items),
+                                             total=len(items)))
 
             return results_ret
 
         else:
 
-            items = [[dir, False, params[i], False] for i in range(len(params))]
-
-            items = [[dir, False, params[i], False] for i in range(len(params))]
-
             futures = client.map(self.copy_and_run_star, items)
             results = client.gather(futures)
 